@@ -1,37 +1,183 @@
 import psycopg2
+from psycopg2 import pool
+from psycopg2.extras import execute_values
 import pandas as pd
 
 
 import os
+import threading
+import time
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _connection_pool():
+    # FastAPI runs these sync endpoints in a threadpool, so the pool must
+    # be threaded and its lazy init locked
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pool.ThreadedConnectionPool(
+                    1, 20,
+                    host=os.getenv("DB_HOST"),
+                    database=os.getenv("DB_NAME"),
+                    user=os.getenv("DB_USER"),
+                    password=os.getenv("DB_PASSWORD"),
+                    port=int(os.getenv("DB_PORT", 6543)),
+                    sslmode="require"
+                )
+    return _pool
+
 
 def get_conn():
-    return psycopg2.connect(
-        host=os.getenv("DB_HOST"),
-        database=os.getenv("DB_NAME"),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        port=int(os.getenv("DB_PORT", 6543)),
-        sslmode="require"
-    )
+    return _connection_pool().getconn()
+
+
+def put_conn(conn):
+    try:
+        _connection_pool().putconn(conn)
+    except pool.PoolError:
+        # the connection has no slot in the pool; just close it
+        conn.close()
+
+
+def _discard_conn(conn):
+    """Drop a broken connection so the pool replaces it with a fresh one."""
+    try:
+        _connection_pool().putconn(conn, close=True)
+    except Exception:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _write_conn():
+    # Ping before writing so a stale pooled connection (Supabase drops
+    # idle ones) is replaced up front instead of by re-running a statement
+    # the server may already have applied.
+    for _ in range(2):
+        conn = get_conn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return conn
+        except psycopg2.OperationalError:
+            _discard_conn(conn)
+    return get_conn()
+
+
+# Read cache: dashboard, budgets and the transaction endpoints all reissue
+# the same SELECTs within a single interaction burst. Entries expire after
+# CACHE_TTL seconds and every write clears the whole cache.
+CACHE_TTL = 60
+
+_cache = {}
+_cache_generation = 0
+
 
+def clear_cache():
+    global _cache_generation
+    _cache_generation += 1
+    _cache.clear()
 
-print("DB_HOST:", os.getenv("DB_HOST"))
-print("DB_NAME:", os.getenv("DB_NAME"))
-print("DB_USER:", os.getenv("DB_USER"))
 
-def load_df(query, params=None):
+def load_df(query, params=None, parse_dates=None):
+    key = (query, None if params is None else tuple(params))
+    hit = _cache.get(key)
+    if hit is not None and time.time() - hit[0] < CACHE_TTL:
+        return hit[1].copy()
+
+    generation = _cache_generation
+    try:
+        df = _load_df(query, params, parse_dates)
+    except psycopg2.OperationalError:
+        # stale pooled connection; retry the SELECT on a fresh one
+        df = _load_df(query, params, parse_dates)
+
+    # skip the fill if a write landed mid-query: this snapshot may
+    # predate the write and would serve stale rows until the TTL expires
+    if generation == _cache_generation:
+        _cache[key] = (time.time(), df)
+    return df.copy()
+
+def _load_df(query, params, parse_dates=None):
     conn = get_conn()
     try:
-        return pd.read_sql(query, conn, params=params)
-    finally:
-        conn.close()
+        df = pd.read_sql(
+            query, conn, params=params, parse_dates=parse_dates,
+            dtype_backend="pyarrow"
+        )
+    except psycopg2.OperationalError:
+        _discard_conn(conn)
+        raise
+    except Exception:
+        put_conn(conn)
+        raise
+    put_conn(conn)
+    return df
 
 def execute(query, params=None):
-    conn = get_conn()
+    conn = _write_conn()
     try:
         with conn.cursor() as cur:
             cur.execute(query, params)
         conn.commit()
-    finally:
-        conn.close()
+    except psycopg2.OperationalError:
+        _discard_conn(conn)
+        raise
+    except Exception:
+        put_conn(conn)
+        raise
+    put_conn(conn)
+    clear_cache()
+
+def execute_returning(query, params=None):
+    """Like execute, but returns the first result row (INSERT ... RETURNING)."""
+    conn = _write_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            row = cur.fetchone()
+        conn.commit()
+    except psycopg2.OperationalError:
+        _discard_conn(conn)
+        raise
+    except Exception:
+        put_conn(conn)
+        raise
+    put_conn(conn)
+    clear_cache()
+    return row
 
+def ensure_indexes():
+    """Create the indexes the month-range and type/category filters rely on."""
+    for statement in (
+        "CREATE INDEX IF NOT EXISTS idx_income_date ON income (date)",
+        "CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses (date)",
+        "CREATE INDEX IF NOT EXISTS idx_income_type_category ON income (income_type, category)",
+        "CREATE INDEX IF NOT EXISTS idx_expenses_type_category ON expenses (expense_type, category)",
+        "CREATE INDEX IF NOT EXISTS idx_budgets_month ON budgets (month)",
+    ):
+        execute(statement)
+
+def execute_many(query, rows):
+    """Run a VALUES %s query for all rows in one round-trip."""
+    if not rows:
+        return
+    conn = _write_conn()
+    try:
+        with conn.cursor() as cur:
+            execute_values(cur, query, rows, page_size=1000)
+        conn.commit()
+    except psycopg2.OperationalError:
+        _discard_conn(conn)
+        raise
+    except Exception:
+        put_conn(conn)
+        raise
+    put_conn(conn)
+    clear_cache()
@@ -6,10 +6,9 @@ import os
 
 load_dotenv()
 
-print("LOADED DB HOST:", os.getenv("DB_HOST"))
-
 from backend.services.income_service import (
     get_all_income,
+    get_income_for_month,
     add_income,
     delete_income,
 )
@@ -18,6 +17,7 @@ from typing import Optional
 
 from backend.services.expense_service import (
     get_all_expenses,
+    get_expenses_for_month,
     add_expense,
     delete_expenses,
 )
@@ -25,7 +25,6 @@ from backend.services.expense_service import (
 from backend.services.dashboard_service import get_dashboard_summary
 
 app = FastAPI()
-from fastapi.middleware.cors import CORSMiddleware
 
 app.add_middleware(
     CORSMiddleware,
@@ -42,6 +41,15 @@ app.add_middleware(
 
 from backend.auth import create_token, verify_token
 
+from backend.db import ensure_indexes
+
+@app.on_event("startup")
+def create_indexes():
+    try:
+        ensure_indexes()
+    except Exception as e:
+        print("INDEX SETUP FAILED:", e)
+
 class IncomeCreate(BaseModel):
     date: str
     source: str
@@ -62,7 +70,7 @@ def root():
     return {"message": "Budget API is alive"}
 
 
-from backend.services.auth_service import authenticate_user
+from backend.services.auth_service import authenticate_user, create_user
 
 class LoginRequest(BaseModel):
     username: str
@@ -73,12 +81,8 @@ class LoginRequest(BaseModel):
 @app.post("/login")
 def login(data: LoginRequest):
     try:
-        print("LOGIN ATTEMPT:", data.username)
-
         user = authenticate_user(data.username, data.password)
 
-        print("USER RESULT:", user)
-
         if user:
             return {"access_token": create_token(user["username"])}
 
@@ -88,10 +92,6 @@ def login(data: LoginRequest):
         print("🔥 LOGIN CRASH:", e)
         return {"error": str(e)}
 
-from backend.services.auth_service import create_user
-
-from pydantic import BaseModel
-
 class RegisterRequest(BaseModel):
     username: str
     password: str
@@ -110,24 +110,21 @@ def register(data: RegisterRequest):
 
 @app.get("/income")
 def get_income(month: Optional[str] = Query(None), user: str = Depends(verify_token)):
-    df = get_all_income()
-
-    if month:
-        df = df[df["Month"] == month]
+    df = get_income_for_month(month) if month else get_all_income()
 
     return df.to_dict(orient="records")
 
 
 @app.post("/income")
 def create_income(income: IncomeCreate, user: str = Depends(verify_token)):
-    add_income(
+    new_id = add_income(
         income.date,
         income.source,
         income.category,
         income.amount,
         income.income_type,
     )
-    return {"status": "created"}
+    return {"status": "created", "id": new_id}
 
 @app.put("/income/{income_id}")
 def update_income_api(income_id: int, income: IncomeCreate, user: str = Depends(verify_token)):
@@ -142,6 +139,20 @@ def update_income_api(income_id: int, income: IncomeCreate, user: str = Depends(
     )
     return {"status": "updated"}
 
+class IncomeUpdate(IncomeCreate):
+    id: int
+
+
+@app.put("/income")
+def bulk_update_income(rows: list[IncomeUpdate], user: str = Depends(verify_token)):
+    from backend.services.income_service import update_incomes
+
+    update_incomes([
+        (r.id, r.date, r.source, r.category, r.amount)
+        for r in rows
+    ])
+    return {"status": "updated", "count": len(rows)}
+
 @app.delete("/income/{income_id}")
 def remove_income(income_id: int , user: str = Depends(verify_token)):
     delete_income([income_id])
@@ -149,16 +160,13 @@ def remove_income(income_id: int , user: str = Depends(verify_token)):
 
 @app.get("/expenses")
 def get_expenses(month: Optional[str] = Query(None),user: str = Depends(verify_token)):
-    df = get_all_expenses()
-
-    if month:
-        df = df[df["Month"] == month]
+    df = get_expenses_for_month(month) if month else get_all_expenses()
 
     return df.to_dict(orient="records")
 
 @app.post("/expenses")
 def create_expense(expense: ExpenseCreate, user: str = Depends(verify_token)):
-    add_expense(
+    new_id = add_expense(
         expense.date,
         expense.name,
         expense.category,
@@ -166,7 +174,7 @@ def create_expense(expense: ExpenseCreate, user: str = Depends(verify_token)):
         expense.payment_method,
         expense.expense_type,
     )
-    return {"status": "created"}
+    return {"status": "created", "id": new_id}
 
 @app.put("/expenses/{expense_id}")
 def update_expense_api(expense_id: int, expense: ExpenseCreate , user: str = Depends(verify_token)):
@@ -182,6 +190,20 @@ def update_expense_api(expense_id: int, expense: ExpenseCreate , user: str = Dep
     )
     return {"status": "updated"}
 
+class ExpenseUpdate(ExpenseCreate):
+    id: int
+
+
+@app.put("/expenses")
+def bulk_update_expenses(rows: list[ExpenseUpdate], user: str = Depends(verify_token)):
+    from backend.services.expense_service import update_expenses
+
+    update_expenses([
+        (r.id, r.date, r.name, r.category, r.amount, r.payment_method)
+        for r in rows
+    ])
+    return {"status": "updated", "count": len(rows)}
+
 @app.delete("/expenses/{expense_id}")
 def remove_expense(expense_id: int, user: str = Depends(verify_token)):
     delete_expenses([expense_id])
@@ -195,6 +217,8 @@ def dashboard_summary(month: str , user: str = Depends(verify_token)):
 
 from backend.services.budget_service import (
     get_budgets_for_month,
+    get_budget_vs_actual,
+    add_or_update_budget,
     auto_apply_recurring_budgets
 )
 
@@ -207,7 +231,14 @@ def fetch_budgets(month: str, user: str = Depends(verify_token)):
     df = get_budgets_for_month(month)
     return df.to_dict(orient="records")
 
-from backend.services.budget_service import add_or_update_budget
+@app.get("/budget-vs-actual")
+def budget_vs_actual(month: str, user: str = Depends(verify_token)):
+
+    # carry recurring budgets forward, same as fetch_budgets
+    auto_apply_recurring_budgets(month)
+
+    df = get_budget_vs_actual(month)
+    return df.to_dict(orient="records")
 
 class BudgetUpdate(BaseModel):
     month: str
@@ -218,8 +249,6 @@ class BudgetUpdate(BaseModel):
 
 @app.post("/budgets")
 def save_budget(data: BudgetUpdate, user: str = Depends(verify_token)):
-    print("🔥 SAVING:", data)
-
     add_or_update_budget(
         data.month,
         data.category,
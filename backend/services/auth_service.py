@@ -20,8 +20,6 @@ def create_user(username: str, password: str):
         "INSERT INTO users (username, password_hash) VALUES (%s, %s)",
         (username, hashed)
     )
-    print("PASSWORD RECEIVED:", password)
-    print("LENGTH:", len(password))
 
 
 def authenticate_user(username: str, password: str):
@@ -1,7 +1,27 @@
-from backend.db import load_df, execute
+from backend.db import load_df, execute, execute_many
+from backend.services.utils import month_bounds
 import pandas as pd
 
 
+def get_budget_vs_actual(month: str):
+    """Budgeted amount and actual spend per category, joined in SQL."""
+    start, end = month_bounds(month)
+    return load_df(
+        """
+        SELECT b.category, b.budget, s.spent
+        FROM budgets b
+        JOIN (
+            SELECT category, SUM(amount) AS spent
+            FROM expenses
+            WHERE date >= %s AND date < %s
+            GROUP BY category
+        ) s ON s.category = b.category
+        WHERE b.month = %s AND b.budget > 0
+        """,
+        (start, end, month)
+    )
+
+
 def get_budgets_for_month(month: str):
     return load_df(
         """
@@ -69,18 +89,17 @@ def auto_apply_recurring_budgets(target_month):
         (target_month,)
     )
 
-    existing = set(current["category"])
-    added = []
-
-    for _, r in prev_budgets.iterrows():
-        if r["category"] not in existing:
-            execute(
-                """
-                INSERT INTO budgets (month, category, budget, is_recurring)
-                VALUES (%s,%s,%s,TRUE)
-                """,
-                (target_month, r["category"], r["budget"])
-            )
-            added.append(r["category"])
-
-    return added
\ No newline at end of file
+    missing = prev_budgets[~prev_budgets["category"].isin(current["category"])]
+
+    execute_many(
+        """
+        INSERT INTO budgets (month, category, budget, is_recurring)
+        VALUES %s
+        """,
+        [
+            (target_month, category, float(budget), True)
+            for category, budget in zip(missing["category"], missing["budget"])
+        ]
+    )
+
+    return missing["category"].tolist()
\ No newline at end of file
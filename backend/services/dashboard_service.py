@@ -1,19 +1,27 @@
-from backend.services.income_service import get_all_income
-from backend.services.expense_service import get_all_expenses
+from backend.db import load_df
+from backend.services.utils import month_bounds
 
 
 def get_dashboard_summary(month: str):
-    income_df = get_all_income()
-    expense_df = get_all_expenses()
+    start, end = month_bounds(month)
 
-    income_total = income_df[income_df["Month"] == month]["amount"].sum()
-    expense_total = expense_df[expense_df["Month"] == month]["amount"].sum()
+    totals = load_df(
+        """
+        SELECT
+            (SELECT COALESCE(SUM(amount), 0) FROM income
+             WHERE date >= %s AND date < %s) AS income_total,
+            (SELECT COALESCE(SUM(amount), 0) FROM expenses
+             WHERE date >= %s AND date < %s) AS expense_total
+        """,
+        (start, end, start, end)
+    )
 
-    balance = income_total - expense_total
+    income_total = float(totals["income_total"].iloc[0])
+    expense_total = float(totals["expense_total"].iloc[0])
 
     return {
         "month": month,
-        "income_total": float(income_total),
-        "expense_total": float(expense_total),
-        "balance": float(balance),
-    }
\ No newline at end of file
+        "income_total": income_total,
+        "expense_total": expense_total,
+        "balance": income_total - expense_total,
+    }
@@ -1,28 +1,53 @@
 import pandas as pd
-from backend.db import load_df, execute
+from backend.db import load_df, execute, execute_many, execute_returning
+from backend.services.utils import month_bounds
 
 
-def get_all_expenses():
-    df = load_df("SELECT * FROM expenses ORDER BY date DESC")
-
+def _prepare(df):
     if df.empty:
         df["Month"] = []
         return df
 
-    df["date"] = pd.to_datetime(df["date"], format="mixed")
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"], format="mixed")
     df["Month"] = df["date"].dt.to_period("M").astype(str)
-    return df
+    # float64, not downcast: these frames are serialized into API JSON and
+    # float32 mangles money values (17.99 -> 17.989999771118164)
+    df["amount"] = pd.to_numeric(df["amount"])
+    for col in ("category", "payment_method", "expense_type"):
+        df[col] = df[col].astype("category")
+    # the column inserts above fragment the frame into one block per
+    # column; copy once so downstream filters work on consolidated data
+    return df.copy()
+
+
+def get_all_expenses():
+    return _prepare(load_df(
+        "SELECT * FROM expenses ORDER BY date DESC",
+        parse_dates=["date"]
+    ))
+
+
+def get_expenses_for_month(month):
+    start, end = month_bounds(month)
+    return _prepare(load_df(
+        "SELECT * FROM expenses WHERE date >= %s AND date < %s ORDER BY date DESC",
+        (start, end),
+        parse_dates=["date"]
+    ))
 
 
 def add_expense(date, name, category, amount, payment_method, expense_type):
-    execute(
+    row = execute_returning(
         """
         INSERT INTO expenses
         (date, name, category, amount, payment_method, expense_type)
         VALUES (%s,%s,%s,%s,%s,%s)
+        RETURNING id
         """,
         (date, name, category, amount, payment_method, expense_type)
     )
+    return row[0]
 
 
 def update_expense(id, date, name, category, amount, payment_method):
@@ -37,6 +62,23 @@ def update_expense(id, date, name, category, amount, payment_method):
     )
 
 
+def update_expenses(rows):
+    """Batch-update edited rows in one round-trip.
+
+    rows: list of (id, date, name, category, amount, payment_method) tuples.
+    """
+    execute_many(
+        """
+        UPDATE expenses AS e
+        SET date=v.date::date, name=v.name, category=v.category,
+            amount=v.amount, payment_method=v.payment_method
+        FROM (VALUES %s) AS v(id, date, name, category, amount, payment_method)
+        WHERE e.id = v.id
+        """,
+        rows
+    )
+
+
 def delete_expenses(ids: list[int]):
     execute(
         "DELETE FROM expenses WHERE id = ANY(%s)",
@@ -46,34 +88,33 @@ def delete_expenses(ids: list[int]):
 
 def auto_apply_recurring_expenses(expense_df, target_month):
     recurring = expense_df[expense_df["expense_type"] == "Recurring"]
+    recurring = recurring.drop_duplicates(subset=["name", "category"])
 
     if recurring.empty:
         return []
 
-    added = []
+    month_tx = expense_df[expense_df["Month"] == target_month]
+    existing = set(zip(month_tx["name"], month_tx["category"]))
 
-    for _, r in recurring.iterrows():
-        exists = expense_df[
-            (expense_df["Month"] == target_month) &
-            (expense_df["name"] == r["name"]) &
-            (expense_df["category"] == r["category"])
-        ]
+    missing = recurring[[
+        key not in existing
+        for key in zip(recurring["name"], recurring["category"])
+    ]]
 
-        if exists.empty:
-            execute(
-                """
-                INSERT INTO expenses
-                (date, name, category, amount, payment_method, expense_type)
-                VALUES (%s,%s,%s,%s,%s,'Recurring')
-                """,
-                (
-                    pd.to_datetime(f"{target_month}-01"),
-                    r["name"],
-                    r["category"],
-                    r["amount"],
-                    r["payment_method"]
-                )
+    first_day = pd.to_datetime(f"{target_month}-01")
+    execute_many(
+        """
+        INSERT INTO expenses
+        (date, name, category, amount, payment_method, expense_type)
+        VALUES %s
+        """,
+        [
+            (first_day, name, category, float(amount), payment, "Recurring")
+            for name, category, amount, payment in zip(
+                missing["name"], missing["category"],
+                missing["amount"], missing["payment_method"]
             )
-            added.append(r["name"])
+        ]
+    )
 
-    return added
\ No newline at end of file
+    return missing["name"].tolist()
\ No newline at end of file
@@ -1,27 +1,52 @@
 import pandas as pd
-from backend.db import load_df, execute
+from backend.db import load_df, execute, execute_many, execute_returning
+from backend.services.utils import month_bounds
 
 
-def get_all_income():
-    df = load_df("SELECT * FROM income ORDER BY date DESC")
-
+def _prepare(df):
     if df.empty:
         df["Month"] = []
         return df
 
-    df["date"] = pd.to_datetime(df["date"], format="mixed")
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"], format="mixed")
     df["Month"] = df["date"].dt.to_period("M").astype(str)
-    return df
+    # float64, not downcast: these frames are serialized into API JSON and
+    # float32 mangles money values (17.99 -> 17.989999771118164)
+    df["amount"] = pd.to_numeric(df["amount"])
+    for col in ("category", "income_type"):
+        df[col] = df[col].astype("category")
+    # the column inserts above fragment the frame into one block per
+    # column; copy once so downstream filters work on consolidated data
+    return df.copy()
+
+
+def get_all_income():
+    return _prepare(load_df(
+        "SELECT * FROM income ORDER BY date DESC",
+        parse_dates=["date"]
+    ))
+
+
+def get_income_for_month(month):
+    start, end = month_bounds(month)
+    return _prepare(load_df(
+        "SELECT * FROM income WHERE date >= %s AND date < %s ORDER BY date DESC",
+        (start, end),
+        parse_dates=["date"]
+    ))
 
 
 def add_income(date, source, category, amount, income_type):
-    execute(
+    row = execute_returning(
         """
         INSERT INTO income (date, source, category, amount, income_type)
         VALUES (%s,%s,%s,%s,%s)
+        RETURNING id
         """,
         (date, source, category, amount, income_type)
     )
+    return row[0]
 
 
 def update_income(id, date, source, category, amount):
@@ -35,6 +60,23 @@ def update_income(id, date, source, category, amount):
     )
 
 
+def update_incomes(rows):
+    """Batch-update edited rows in one round-trip.
+
+    rows: list of (id, date, source, category, amount) tuples.
+    """
+    execute_many(
+        """
+        UPDATE income AS i
+        SET date=v.date::date, source=v.source,
+            category=v.category, amount=v.amount
+        FROM (VALUES %s) AS v(id, date, source, category, amount)
+        WHERE i.id = v.id
+        """,
+        rows
+    )
+
+
 def delete_income(ids: list[int]):
     execute(
         "DELETE FROM income WHERE id = ANY(%s)",
@@ -44,32 +86,31 @@ def delete_income(ids: list[int]):
 
 def auto_apply_recurring_income(income_df, target_month):
     recurring = income_df[income_df["income_type"] == "Recurring"]
+    recurring = recurring.drop_duplicates(subset=["source", "category"])
     if recurring.empty:
         return []
 
-    added = []
+    month_tx = income_df[income_df["Month"] == target_month]
+    existing = set(zip(month_tx["source"], month_tx["category"]))
 
-    for _, r in recurring.iterrows():
-        exists = income_df[
-            (income_df["Month"] == target_month) &
-            (income_df["source"] == r["source"]) &
-            (income_df["category"] == r["category"])
-        ]
+    missing = recurring[[
+        key not in existing
+        for key in zip(recurring["source"], recurring["category"])
+    ]]
 
-        if exists.empty:
-            execute(
-                """
-                INSERT INTO income
-                (date, source, category, amount, income_type)
-                VALUES (%s,%s,%s,%s,'Recurring')
-                """,
-                (
-                    pd.to_datetime(f"{target_month}-01"),
-                    r["source"],
-                    r["category"],
-                    r["amount"]
-                )
+    first_day = pd.to_datetime(f"{target_month}-01")
+    execute_many(
+        """
+        INSERT INTO income
+        (date, source, category, amount, income_type)
+        VALUES %s
+        """,
+        [
+            (first_day, source, category, float(amount), "Recurring")
+            for source, category, amount in zip(
+                missing["source"], missing["category"], missing["amount"]
             )
-            added.append(r["source"])
+        ]
+    )
 
-    return added
\ No newline at end of file
+    return missing["source"].tolist()
\ No newline at end of file
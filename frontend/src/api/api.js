@@ -12,8 +12,6 @@ export async function getIncome(month) {
     throw new Error("No token found");
   }
 
-  console.log("TOKEN SENT:", token);
-
   const res = await fetch(
     `${API_URL}/income?month=${month}`,
     {
@@ -58,8 +56,6 @@ export async function getExpenses(month) {
     throw new Error("No token found");
   }
 
-  console.log("TOKEN SENT:", token);
-
   const res = await fetch(
     `${API_URL}/expenses?month=${month}`,
     {
@@ -95,6 +91,18 @@ export async function getBudgets(month) {
   return await res.json();
 }
 
+export async function getBudgetVsActual(month) {
+  const token = localStorage.getItem("token");
+
+  const res = await fetch(`${API_URL}/budget-vs-actual?month=${month}`, {
+    headers: {
+      Authorization: `Bearer ${token}`,
+    },
+  });
+
+  return await res.json();
+}
+
 export async function saveBudget(month, category, amount) {
   const token = localStorage.getItem("token");
 
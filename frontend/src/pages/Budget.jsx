@@ -1,33 +1,12 @@
 import { useEffect, useState } from "react";
 import { getExpenses, getBudgets, saveBudget } from "../api/api";
 import { bumpCacheVersion } from "../utils/cache";
-
-
-// ==============================
-// 📅 Month Generator
-// ==============================
-function generateMonths() {
-  const today = new Date();
-  const year = today.getFullYear();
-  const month = today.getMonth() + 1;
-
-  let months = [];
-
-  for (let i = 1; i <= month; i++) {
-    months.push(`${year}-${String(i).padStart(2, "0")}`);
-  }
-
-  if (month < 12) {
-    months.push(`${year}-${String(month + 1).padStart(2, "0")}`);
-  }
-
-  return months;
-}
+import { MONTHS, DEFAULT_MONTH } from "../utils/months";
 
 export default function Budget() {
-  const months = generateMonths();
+  const months = MONTHS;
 
-  const [month, setMonth] = useState(months[months.length - 2]);
+  const [month, setMonth] = useState(DEFAULT_MONTH);
   const [expenses, setExpenses] = useState([]);
   const [budgets, setBudgets] = useState({});
 
@@ -1,32 +1,12 @@
 import { useEffect, useState } from "react";
-import { getIncome, getExpenses, getBudgets } from "../api/api";
+import { getIncome, getExpenses, getBudgetVsActual } from "../api/api";
 import {
   PieChart, Pie, Cell, Tooltip,
   BarChart, Bar, XAxis, YAxis, CartesianGrid,
   LineChart, Line, Legend
 } from "recharts";
 import { getCacheVersion } from "../utils/cache";
-
-// ==============================
-// 📅 MONTH GENERATOR
-// ==============================
-function generateMonths() {
-  const today = new Date();
-  const year = today.getFullYear();
-  const month = today.getMonth() + 1;
-
-  let months = [];
-
-  for (let i = 1; i <= month; i++) {
-    months.push(`${year}-${String(i).padStart(2, "0")}`);
-  }
-
-  if (month < 12) {
-    months.push(`${year}-${String(month + 1).padStart(2, "0")}`);
-  }
-
-  return months;
-}
+import { MONTHS, DEFAULT_MONTH } from "../utils/months";
 
 const COLORS = ["#6366f1", "#22c55e", "#f59e0b", "#ef4444"];
 
@@ -38,14 +18,14 @@ const Info = ({ text }) => (
 
 
 export default function Dashboard() {
-  const months = generateMonths();
-  const [month, setMonth] = useState(months[months.length - 2]);
+  const months = MONTHS;
+  const [month, setMonth] = useState(DEFAULT_MONTH);
 
   const [income, setIncome] = useState([]);
   const [expenses, setExpenses] = useState([]);
   const [trendData, setTrendData] = useState([]);
 
-  const [budgets, setBudgets] = useState({});
+  const [budgetData, setBudgetData] = useState([]);
 
   const [corpus, setCorpus] = useState(
     Number(localStorage.getItem("corpus")) || 0
@@ -132,15 +112,9 @@ export default function Dashboard() {
       const token = localStorage.getItem("token");
       if (!token) return;
 
-      getBudgets(month)
-        .then((res) => {
-          const mapped = {};
-          res.forEach((b) => {
-            mapped[b.category] = b.budget;
-          });
-          setBudgets(mapped);
-        })
-        .catch(() => setBudgets({}));
+      getBudgetVsActual(month)
+        .then((res) => setBudgetData(Array.isArray(res) ? res : []))
+        .catch(() => setBudgetData([]));
     }, [month]);
 
 
@@ -231,25 +205,6 @@ export default function Dashboard() {
     { name: "Variable", value: variableTotal }
   ];
 
-const budgetData = Object.entries(
-  expenses.reduce((acc, e) => {
-    acc[e.category] = (acc[e.category] || 0) + e.amount;
-    return acc;
-  }, {})
-)
-.map(([category, spent]) => {
-  const budget = budgets[category];
-
-  if (!budget || budget <= 0) return null;
-
-  return {
-    category,
-    spent,
-    budget
-  };
-})
-.filter(Boolean);
-
   // ==============================
   // 📈 WEALTH GRAPH
   // ==============================
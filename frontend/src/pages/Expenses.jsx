@@ -1,34 +1,11 @@
 import { useEffect, useState } from "react";
 import { getExpenses } from "../api/api";
 import { bumpCacheVersion } from "../utils/cache";
+import { MONTHS, DEFAULT_MONTH } from "../utils/months";
 import Select from "react-select";
 
 const API_URL = "https://budget-expense-tracker-backend-o965.onrender.com";
 
-
-// ==============================
-// 📅 Month Generator
-// ==============================
-function generateMonths() {
-  const today = new Date();
-  const year = today.getFullYear();
-  const month = today.getMonth() + 1;
-
-  let months = [];
-
-  for (let i = 1; i <= month; i++) {
-    const m = String(i).padStart(2, "0");
-    months.push(`${year}-${m}`);
-  }
-
-  const nextMonth = month + 1;
-  if (nextMonth <= 12) {
-    months.push(`${year}-${String(nextMonth).padStart(2, "0")}`);
-  }
-
-  return months;
-}
-
 // ==============================
 // 📂 CONSTANTS (MATCH STREAMLIT)
 // ==============================
@@ -51,12 +28,12 @@ const PAYMENT_METHODS = [
 
 export default function Expenses() {
 
-  const months = generateMonths();
+  const months = MONTHS;
 
   // ==============================
   // 🔥 STATE
   // ==============================
-  const [month, setMonth] = useState(months[months.length - 2]);
+  const [month, setMonth] = useState(DEFAULT_MONTH);
   const [data, setData] = useState([]);
   const [editedData, setEditedData] = useState([]);
 
@@ -137,9 +114,16 @@ export default function Expenses() {
 
       bumpCacheVersion(); //
 
-      const updated = await getExpenses(month);
-      setData(updated);
-      setEditedData(updated);
+      const created = await res.json();
+      const newRow = {
+        ...newItem,
+        id: created.id,
+        amount: Number(newItem.amount),
+        expense_type: tab,
+        Month: newItem.date.slice(0, 7)
+      };
+      setData([newRow, ...data]);
+      setEditedData([newRow, ...editedData]);
 
       setNewItem({
         date: "",
@@ -204,23 +188,40 @@ export default function Expenses() {
   // ==============================
   // SAVE
   // ==============================
+  const EDITABLE_FIELDS = ["date", "name", "category", "amount", "payment_method"];
+
+  // dates come back as ISO timestamps but edits are plain YYYY-MM-DD
+  const fieldValue = (field, value) =>
+    field === "date" ? String(value ?? "").split("T")[0] : String(value ?? "");
+
   const handleSave = async () => {
     const token = localStorage.getItem("token");
 
-    for (const item of editedData) {
-      await fetch(`${API_URL}/expenses/${item.id}`, {
-        method: "PUT",
-        headers: {
-          "Content-Type": "application/json",
-          Authorization: `Bearer ${token}`
-        },
-        body: JSON.stringify({
+    const original = new Map(data.map(r => [r.id, r]));
+
+    const changed = editedData.filter(item => {
+      const orig = original.get(item.id);
+      return !orig || EDITABLE_FIELDS.some(
+        f => fieldValue(f, item[f]) !== fieldValue(f, orig[f])
+      );
+    });
+
+    if (changed.length === 0) return;
+
+    await fetch(`${API_URL}/expenses`, {
+      method: "PUT",
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Bearer ${token}`
+      },
+      body: JSON.stringify(
+        changed.map(item => ({
           ...item,
           amount: Number(item.amount),
           expense_type: item.expense_type
-        })
-      });
-    }
+        }))
+      )
+    });
 
     const refreshed = await getExpenses(month);
     setData(refreshed);
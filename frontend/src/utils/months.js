@@ -0,0 +1,23 @@
+// Months of the current year up to next month. The list only depends on
+// today's date, so compute it once at module load instead of per render.
+function generateMonths() {
+  const today = new Date();
+  const year = today.getFullYear();
+  const month = today.getMonth() + 1;
+
+  let months = [];
+
+  for (let i = 1; i <= month; i++) {
+    months.push(`${year}-${String(i).padStart(2, "0")}`);
+  }
+
+  if (month < 12) {
+    months.push(`${year}-${String(month + 1).padStart(2, "0")}`);
+  }
+
+  return months;
+}
+
+export const MONTHS = generateMonths();
+
+export const DEFAULT_MONTH = MONTHS[MONTHS.length - 2];